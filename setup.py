@@ -16,6 +16,15 @@ __version__ = "0.0.0"
 
 exec(open(join(dirname(__file__), 'vot', 'version.py')).read())
 
+# Compiled coercion loops are optional, the toolkit falls back to the pure
+# Python implementation when Cython is not available
+ext_modules = []
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize([join('vot', 'utilities', '_coerce.pyx')], language_level=3)
+except ImportError:
+    pass
+
 setup(name='vot-toolkit',
     version=__version__,
     description='Perform visual object tracking experiments and analyze results',
@@ -27,6 +36,7 @@ setup(name='vot-toolkit',
     packages=['vot', 'vot.analysis', 'vot.dataset', 'vot.experiment', 'vot.region', 'vot.stack', 'vot.tracker', 'vot.utilities'],
     install_requires=install_requires,
     include_package_data=True,
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
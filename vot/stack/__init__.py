@@ -1,11 +1,14 @@
 import os
 import json
-import glob
 import collections
+import functools
 from typing import List
 
 import yaml
 
+# Use the libyaml C binding when available, it is several times faster than the pure-Python loader
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 from vot.experiment import Experiment
 from vot.experiment.transformer import Transformer
 from vot.utilities import import_class
@@ -53,6 +56,7 @@ class Stack(Attributee):
     def __getitem__(self, identifier):
         return self.experiments[identifier]
 
+@functools.lru_cache(maxsize=128)
 def resolve_stack(name, *directories):
     if os.path.isabs(name):
         return name if os.path.isfile(name) else None
@@ -65,11 +69,46 @@ def resolve_stack(name, *directories):
         return full
     return None
 
+def _read_title(path):
+    """Extract the top-level title scalar using the event API, stopping as soon as
+    it is found instead of constructing objects for the entire document."""
+    with open(path, 'r') as fp:
+        depth = 0
+        is_key = True
+        awaiting = False
+        for event in yaml.parse(fp, Loader=_Loader):
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                if depth == 1:
+                    if awaiting:
+                        return ""
+                    is_key = not is_key
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+            elif isinstance(event, yaml.ScalarEvent) and depth == 1:
+                if awaiting:
+                    return event.value
+                if is_key and event.value == "title":
+                    awaiting = True
+                is_key = not is_key
+    return ""
+
+# Cache of stack titles keyed by stack name, entries are revalidated using the file
+# modification time so that only new or changed files are actually parsed
+_stack_index = {}
+
 def list_integrated_stacks():
     stacks = {}
-    for stack_file in glob.glob(os.path.join(os.path.dirname(__file__), "*.yaml")):
-        with open(stack_file, 'r') as fp:
-            stack_metadata = yaml.load(fp, Loader=yaml.BaseLoader)
-        stacks[os.path.splitext(os.path.basename(stack_file))[0]] = stack_metadata.get("title", "")
+    with os.scandir(os.path.dirname(__file__)) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".yaml") or not entry.is_file():
+                continue
+            name = entry.name[:-len(".yaml")]
+            mtime = entry.stat().st_mtime
+            cached = _stack_index.get(name)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, _read_title(entry.path))
+                _stack_index[name] = cached
+            stacks[name] = cached[1]
 
     return stacks
\ No newline at end of file
@@ -6,6 +6,7 @@ import hashlib
 import errno
 import logging
 import inspect
+import functools
 import concurrent.futures as futures
 from logging import Formatter, LogRecord
 
@@ -15,7 +16,8 @@ from typing import Tuple
 import six
 import colorama
 
-def import_class(classpath, hints=None):
+@functools.lru_cache(maxsize=512)
+def _import_class(classpath, hints):
     delimiter = classpath.rfind(".")
     if delimiter == -1:
         if hints is None:
@@ -37,6 +39,11 @@ def import_class(classpath, hints=None):
         module = __import__(classpath[0:delimiter], globals(), locals(), [classname])
         return getattr(module, classname)
 
+def import_class(classpath, hints=None):
+    return _import_class(classpath, tuple(hints) if hints is not None else None)
+
+import_class.cache_clear = _import_class.cache_clear
+
 def class_fullname(o):
     return class_string(o.__class__)
 
@@ -0,0 +1,23 @@
+# cython: language_level=3
+"""Compiled inner loops for Map and List attribute coercion.
+
+The coercion of large parsed YAML trees spends most of its time in the
+per-item dispatch loop, this module moves that loop to C. It is optional,
+vot.utilities.attributes falls back to the pure Python implementation when
+the extension is not compiled.
+"""
+
+cpdef coerce_map(contains, dict value, dict context, object container_factory, object wrap):
+    container = container_factory()
+    coerce = contains.coerce
+    for name, data in value.items():
+        container[name] = coerce(data, dict(key=name, **context))
+    return wrap(container)
+
+cpdef coerce_list(contains, list value, dict context):
+    cdef Py_ssize_t i = 0
+    coerce = contains.coerce
+    result = []
+    for i in range(len(value)):
+        result.append(coerce(value[i], dict(key=i, **context)))
+    return result
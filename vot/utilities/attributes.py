@@ -1,11 +1,18 @@
 
+import types
 import inspect
 from typing import Type
-from collections import Iterable, Mapping
+from collections.abc import Iterable, Mapping
 
 from vot import VOTException
 from vot.utilities import to_number, to_string, to_logical, singleton, import_class, class_fullname, class_string
 
+try:
+    # Optional compiled inner loops for Map and List coercion
+    from vot.utilities import _coerce
+except ImportError:
+    _coerce = None
+
 class AttributeException(VOTException):
     pass
 
@@ -13,10 +20,10 @@ class AttributeException(VOTException):
 class Undefined():
     pass
 
+_UNDEFINED = Undefined()
+
 def is_undefined(a):
-    if a is None:
-        return False
-    return a == Undefined()
+    return a is _UNDEFINED
 
 def is_instance_or_subclass(val, class_) -> bool:
     """Return True if ``val`` is either a subclass or instance of ``class_``."""
@@ -25,22 +32,10 @@ def is_instance_or_subclass(val, class_) -> bool:
     except TypeError:
         return isinstance(val, class_)
 
-class ReadonlyMapping(Mapping):
-
-    def __init__(self, data):
-        self._data = data
-
-    def __getitem__(self, key):
-        return self._data[key]
-
-    def __len__(self):
-        return len(self._data)
-
-    def __iter__(self):
-        return iter(self._data)
-
 class Attribute(object):
 
+    __slots__ = ('_default',)
+
     def __init__(self, default=Undefined()):
         self._default = default if is_undefined(default) else self.coerce(default, {})
 
@@ -60,6 +55,8 @@ class Attribute(object):
 
 class Nested(Attribute):
 
+    __slots__ = ('_acls', '_required')
+
     def __init__(self, acls: Type["Attributee"], **kwargs):
         if not issubclass(acls, Attributee):
             raise AttributeException("Illegal base class {}".format(acls))
@@ -78,7 +75,7 @@ class Nested(Attribute):
             return None
         if is_undefined(value):
             return value
-        assert isinstance(value, Mapping)
+        assert isinstance(value, dict) or isinstance(value, Mapping)
         return self._acls(**value)
 
     def dump(self, value: "Attributee"):
@@ -98,6 +95,16 @@ class Nested(Attribute):
         # This is only here to avoid pylint errors for the actual attribute field
         super().__setattr__(name, value)
 
+def _include_keys(include: "Include"):
+    """Collect all argument names consumed by an include, recursively."""
+    keys = set()
+    for aname, afield in getattr(include._acls, "_declared_attributes", {}).items():
+        if isinstance(afield, Include):
+            keys.update(_include_keys(afield))
+        else:
+            keys.add(aname)
+    return keys
+
 class AttributeeMeta(type):
 
     @staticmethod
@@ -147,56 +154,66 @@ class AttributeeMeta(type):
         # Assign attributes on class
         klass._declared_attributes = dict(inherited_attributes + cls_attributes)
 
+        # Split the attributes once per class so that instance construction does not
+        # have to re-dispatch on the field type for every instance, the required flag
+        # is also resolved here since it is stable after class creation
+        klass._declared_includes = tuple((aname, afield) for aname, afield
+            in klass._declared_attributes.items() if isinstance(afield, Include))
+        klass._declared_regular = tuple((aname, afield, afield.required) for aname, afield
+            in klass._declared_attributes.items() if not isinstance(afield, Include))
+
+        # All argument names that construction can consume, used to detect
+        # unsupported arguments without per-field set bookkeeping
+        consumed = set(klass._declared_attributes.keys())
+        for _, afield in klass._declared_includes:
+            consumed.update(afield._flat_keys)
+        klass._consumed_names = frozenset(consumed)
+
         return klass
 
 class Include(Nested):
 
+    __slots__ = ('_flat_keys',)
+
     def __init__(self, acls: Type["Attributee"]):
         super().__init__(acls)
+        # The include structure is static once the class is defined, so the
+        # recursive walk is flattened into a plain key set here
+        self._flat_keys = frozenset(_include_keys(self))
 
     def filter(self, **kwargs):
-        attributes = getattr(self._acls, "_declared_attributes", {})
-        filtered = dict()
-        for aname, afield in attributes.items():
-            if isinstance(afield, Include):
-                filtered.update(afield.filter(**kwargs))
-            elif aname in kwargs:
-                filtered[aname] = kwargs[aname]
-        return filtered
+        return {aname: avalue for aname, avalue in kwargs.items() if aname in self._flat_keys}
 
     @property
     def default(self):
         return {}
 
+# Bypasses both the readonly check in Attributee.__setattr__ and the implicit
+# super() object construction in the construction hot loop
+_raw_setattr = object.__setattr__
+
 class Attributee(metaclass=AttributeeMeta):
 
     def __init__(self, **kwargs):
-        attributes = getattr(self.__class__, "_declared_attributes", {})
-
-        unconsumed = set(kwargs.keys())
-        unspecified = set(attributes.keys())
-
-        for aname, afield in attributes.items():
-            if isinstance(afield, Include):
-                iargs = afield.filter(**kwargs)
-                super().__setattr__(aname, afield.coerce(iargs, {"parent": self}))
-                unconsumed.difference_update(iargs.keys())
-                unspecified.difference_update(iargs.keys())
+        for aname, afield in self._declared_includes:
+            iargs = afield.filter(**kwargs)
+            _raw_setattr(self, aname, afield.coerce(iargs, {"parent": self}))
+
+        missing = []
+        for aname, afield, arequired in self._declared_regular:
+            if not aname in kwargs:
+                if arequired:
+                    missing.append(aname)
+                    continue
+                avalue = afield.default
             else:
-                if not aname in kwargs:
-                    if not afield.required:
-                        avalue = afield.default
-                    else:
-                        continue
-                else:
-                    avalue = kwargs[aname]
-                super().__setattr__(aname, afield.coerce(avalue, {"parent": self}))
-            unconsumed.difference_update([aname])
-            unspecified.difference_update([aname])
-
-        if unspecified:
-            raise AttributeError("Missing arguments: {}".format(", ".join(unspecified)))
+                avalue = kwargs[aname]
+            _raw_setattr(self, aname, afield.coerce(avalue, {"parent": self}))
 
+        if missing:
+            raise AttributeError("Missing arguments: {}".format(", ".join(missing)))
+
+        unconsumed = set(kwargs).difference(self._consumed_names)
         if unconsumed:
             raise AttributeError("Unsupported arguments: {}".format(", ".join(unconsumed)))
 
@@ -207,21 +224,18 @@ class Attributee(metaclass=AttributeeMeta):
         super().__setattr__(key, value)
 
     def dump(self):
-        attributes = getattr(self.__class__, "_declared_attributes", {})
-        if attributes is None:
-            return dict()
-    
         serialized = dict()
-        for aname, afield in attributes.items():
-            if isinstance(afield, Include):
-                serialized.update(afield.dump(getattr(self, aname, {})))
-            else:
-                serialized[aname] = afield.dump(getattr(self, aname, afield.default))
-                
+        for aname, afield in self._declared_includes:
+            serialized.update(afield.dump(getattr(self, aname, {})))
+        for aname, afield, _ in self._declared_regular:
+            serialized[aname] = afield.dump(getattr(self, aname, afield.default))
+
         return serialized
 
 class Number(Attribute):
 
+    __slots__ = ('_conversion', '_val_min', '_val_max')
+
     def __init__(self, conversion, val_min=None, val_max=None, **kwargs):
         self._conversion = conversion
         self._val_min = val_min
@@ -229,36 +243,55 @@ class Number(Attribute):
         super().__init__(**kwargs)
 
     def coerce(self, value, _=None):
+        # Scalars parsed by the safe YAML loaders already arrive typed
+        if type(value) is self._conversion and \
+            (self._val_min is None or value >= self._val_min) and \
+            (self._val_max is None or value <= self._val_max):
+            return value
         return to_number(value, max_n=self._val_max, min_n=self._val_min, conversion=self._conversion)
 
 class Integer(Number):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(conversion=int, **kwargs)
 
 class Float(Number):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(conversion=float, **kwargs)
 
 class Boolean(Attribute):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
     def coerce(self, value, _):
+        if type(value) is bool:
+            return value
         return to_logical(value)
 
 class String(Attribute):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
     def coerce(self, value, _):
+        if type(value) is str:
+            return value
         return to_string(value)
 
 class List(Attribute):
 
+    __slots__ = ('_separator', '_contains')
+
     def __init__(self, contains, separator=",", **kwargs):
         super().__init__(**kwargs)
         assert isinstance(contains, Attribute)
@@ -268,12 +301,16 @@ class List(Attribute):
     def coerce(self, value, context=None):
         if isinstance(value, str):
             value = value.split(self._separator)
-        if isinstance(value, dict):
+        elif isinstance(value, dict):
             value = value.values()
-        if not isinstance(value, Iterable):
+        # Check the concrete types produced by the YAML parser first, the abstract
+        # base class check walks the ABC registry and is noticeably slower
+        if not isinstance(value, (list, tuple)) and not isinstance(value, Iterable):
             raise AttributeException("Unable to value convert to list")
         if context is None:
             context = dict()
+        if _coerce is not None and type(value) is list and value:
+            return _coerce.coerce_list(self._contains, value, context)
         return [self._contains.coerce(x, dict(key=i, **context)) for i, x in enumerate(value)]
 
     def __iter__(self):
@@ -293,6 +330,8 @@ class List(Attribute):
 
 class Map(Attribute):
 
+    __slots__ = ('_contains', '_container')
+
     def __init__(self, contains, container=dict, **kwargs):
         super().__init__(**kwargs)
         assert isinstance(contains, Attribute)
@@ -300,14 +339,16 @@ class Map(Attribute):
         self._container = container
 
     def coerce(self, value, context=None):
-        if not isinstance(value, Mapping):
+        if not isinstance(value, dict) and not isinstance(value, Mapping):
             raise AttributeException("Unable to value convert to dict")
-        container = self._container()
         if context is None:
             context = dict()
+        if _coerce is not None and type(value) is dict and value:
+            return _coerce.coerce_map(self._contains, value, context, self._container, types.MappingProxyType)
+        container = self._container()
         for name, data in value.items():
             container[name] = self._contains.coerce(data, dict(key=name, **context))
-        return ReadonlyMapping(container)
+        return types.MappingProxyType(container)
 
     def __iter__(self):
         # This is only here to avoid pylint errors for the actual attribute field
@@ -342,6 +383,8 @@ def default_object_resolver(typename: str, _, **kwargs) -> Attributee:
 
 class Object(Attribute):
 
+    __slots__ = ('_resolver',)
+
     def __init__(self, resolver=default_object_resolver, **kwargs):
         super().__init__(**kwargs)
         self._resolver = resolver
@@ -366,6 +409,8 @@ class Object(Attribute):
 
 class Callable(Attribute):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
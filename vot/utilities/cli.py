@@ -224,6 +224,9 @@ def do_analysis(config, logger):
 
     executor.shutdown(wait=True)
 
+    if isinstance(cache, Cache):
+        cache.flush()
+
     if results is None:
         return
 
@@ -1,7 +1,8 @@
 
 import os
-import glob
+import atexit
 import logging
+import functools
 from abc import ABC, abstractmethod
 from datetime import datetime
 import pickle
@@ -9,6 +10,9 @@ import pickle
 import yaml
 import cachetools
 
+# Use the libyaml C binding when available, it is several times faster than the pure-Python loader
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 from vot import VOTException
 
 from vot.dataset import VOTDataset, Sequence, Dataset
@@ -20,6 +24,16 @@ from vot.utilities import normalize_path, class_fullname
 
 logger = logging.getLogger("vot")
 
+@functools.lru_cache(maxsize=32)
+def _parse_stack_file(path, mtime):
+    with open(path, 'r') as fp:
+        return yaml.load(fp, Loader=_Loader)
+
+def _load_stack_yaml(path):
+    """Parsed stack metadata, cached on the file path and modification time so that
+    initialization and workspace construction do not parse the same file twice."""
+    return _parse_stack_file(path, os.stat(path).st_mtime)
+
 class WorkspaceException(VOTException):
     pass
 
@@ -54,6 +68,7 @@ class LocalStorage(ABC):
     def __init__(self, root: str):
         self._root = root
         self._results = os.path.join(root, "results")
+        self._results_tree = None
 
     @property
     def base(self):
@@ -63,9 +78,37 @@ class LocalStorage(ABC):
         root = os.path.join(self._results, tracker.reference, experiment.identifier, sequence.name)
         return Results(root)
 
+    def scan_results_tree(self):
+        """Collect the full (tracker, experiment, sequence) directory tree in a single
+        pass and cache it, revalidating on the modification time of the results root."""
+        try:
+            mtime = os.stat(self._results).st_mtime
+        except OSError:
+            return {}
+
+        if self._results_tree is not None and self._results_tree[0] == mtime:
+            return self._results_tree[1]
+
+        tree = {}
+        with os.scandir(self._results) as trackers:
+            for tracker in trackers:
+                if not tracker.is_dir():
+                    continue
+                experiments = {}
+                with os.scandir(tracker.path) as experiment_entries:
+                    for experiment in experiment_entries:
+                        if not experiment.is_dir():
+                            continue
+                        with os.scandir(experiment.path) as sequence_entries:
+                            experiments[experiment.name] = {entry.name for entry
+                                in sequence_entries if entry.is_dir()}
+                tree[tracker.name] = experiments
+
+        self._results_tree = (mtime, tree)
+        return tree
+
     def list_results(self, registry: "Registry"):
-        references = [os.path.basename(x) for x in glob.glob(os.path.join(self._results, "*")) if os.path.isdir(x)]
-        return registry.resolve(*references)
+        return registry.resolve(*self.scan_results_tree().keys())
 
     def open_log(self, identifier):
 
@@ -98,7 +141,7 @@ class LocalStorage(ABC):
         shutil.move(localfile, os.path.join(self.base, full))
         #with open(localfile, "rb") as fin:
 
-    def directory(self, *args):
+    def _segments(self, args):
         segments = []
         for arg in args:
             if arg is None:
@@ -109,29 +152,43 @@ class LocalStorage(ABC):
                 segments.append(str(arg))
             else:
                 segments.append(class_fullname(arg))
+        return segments
 
-        path = os.path.join(self._root, *segments)
+    @functools.lru_cache(maxsize=1024)
+    def directory(self, *args):
+        path = os.path.join(self._root, *self._segments(args))
         os.makedirs(path, exist_ok=True)
 
         return path
 
+    def directory_path(self, *args):
+        """Resolve the directory like directory() but without creating it, for
+        read-only paths that must not touch the filesystem."""
+        return os.path.join(self._root, *self._segments(args))
+
 class Cache(cachetools.Cache):
 
     def __init__(self, storage: LocalStorage):
         super().__init__(10000)
         self._storage = storage
+        self._dirty = set()
+        self._probed = cachetools.LRUCache(4096)
+        atexit.register(self.flush)
 
-    def _filename(self, key):
+    def _filename(self, key, create=False):
         if isinstance(key, tuple):
             filename = key[-1]
             if len(key) > 1:
-                directory = self._storage.directory(*key[:-1])
+                if create:
+                    directory = self._storage.directory(*key[:-1])
+                else:
+                    directory = self._storage.directory_path(*key[:-1])
             else:
                 directory = self._storage.base
         else:
             filename = str(key)
             directory = self._storage.base
-        return os.path.join(directory, filename)
+        return directory + os.sep + filename
 
     def __getitem__(self, key):
         try:
@@ -150,24 +207,54 @@ class Cache(cachetools.Cache):
 
     def __setitem__(self, key, value):
         super().__setitem__(key, value)
-
-        filename = self._filename(key)
+        self._dirty.add(key)
+
+    def popitem(self):
+        # Persist dirty entries before they are evicted from memory
+        key, value = super().popitem()
+        if key in self._dirty:
+            self._write(key, value)
+            self._dirty.discard(key)
+        return key, value
+
+    def _write(self, key, value):
+        filename = self._filename(key, create=True)
         try:
             with open(filename, mode="wb") as filehandle:
-                return pickle.dump(value, filehandle)
+                pickle.dump(value, filehandle, protocol=pickle.HIGHEST_PROTOCOL)
+            self._probed[key] = True
         except pickle.PickleError:
             pass
 
+    def flush(self):
+        for key in list(self._dirty):
+            try:
+                value = super().__getitem__(key)
+            except KeyError:
+                continue
+            self._write(key, value)
+        self._dirty.clear()
+
     def __contains__(self, key):
-        filename = self._filename(key)
-        return os.path.isfile(filename)
+        if super().__contains__(key):
+            return True
+        exists = self._probed.get(key)
+        if exists is None:
+            exists = os.path.isfile(self._filename(key))
+            self._probed[key] = exists
+        return exists
 
 class Workspace(object):
 
     @staticmethod
     def initialize(directory, config=dict(), download=True):
         config_file = os.path.join(directory, "config.yaml")
-        if os.path.isfile(config_file):
+        try:
+            # A single open syscall instead of a separate stat probe
+            os.close(os.open(config_file, os.O_RDONLY))
+        except FileNotFoundError:
+            pass
+        else:
             raise WorkspaceException("Workspace already initialized")
 
         os.makedirs(directory, exist_ok=True)
@@ -188,10 +275,7 @@ class Workspace(object):
             dataset_directory = normalize_path(config.get("sequences", "sequences"), directory)
             if stack_file is None:
                 return
-            dataset = None
-            with open(stack_file, 'r') as fp:
-                stack_metadata = yaml.load(fp, Loader=yaml.BaseLoader)
-                dataset = stack_metadata["dataset"]
+            dataset = _load_stack_yaml(stack_file)["dataset"]
             if dataset:
                 Workspace.download_dataset(dataset, dataset_directory)
 
@@ -209,11 +293,13 @@ class Workspace(object):
         self._root = directory
         directory = normalize_path(directory)
         config_file = os.path.join(directory, "config.yaml")
-        if not os.path.isfile(config_file):
+        try:
+            fp = open(config_file, 'r')
+        except FileNotFoundError:
             raise WorkspaceException("Workspace not initialized")
 
-        with open(config_file, 'r') as fp:
-            self._config = yaml.load(fp, Loader=yaml.BaseLoader)
+        with fp:
+            self._config = yaml.load(fp, Loader=_Loader)
 
         if not "stack" in self._config:
             raise WorkspaceException("Experiment stack not found in workspace configuration")
@@ -225,9 +311,8 @@ class Workspace(object):
 
         self._storage = LocalStorage(directory)
 
-        with open(stack_file, 'r') as fp:
-            stack_metadata = yaml.load(fp, Loader=yaml.BaseLoader)
-            self._stack = Stack(self, **stack_metadata)
+        stack_metadata = _load_stack_yaml(stack_file)
+        self._stack = Stack(self, **stack_metadata)
 
         dataset_directory = normalize_path(self._config.get("sequences", "sequences"), directory)
 